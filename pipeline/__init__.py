@@ -5,6 +5,7 @@ Modules:
     content_pipeline: Orchestrates generation, validation, and publishing.
     claude_client:    Wraps Anthropic Messages API with retry + caching.
     validator:        Multi-layer content validation (fabrication, length, etc).
+    platforms:        Registry of supported platforms and their limits.
 """
 
 from .content_pipeline import ContentPipeline, PipelineConfig
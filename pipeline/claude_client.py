@@ -6,91 +6,260 @@ See: https://docs.anthropic.com/en/api/messages
 """
 
 import asyncio
+import contextlib
+import functools
+import json
 import os
 import random
+from datetime import datetime, timezone
 
 import anthropic
+import httpx
 from anthropic import RateLimitError, APIError
+from cachetools import TTLCache
 
+from .platforms import PLATFORMS
+from .validator import FabricationScanner
 
-PLATFORM_WORD_LIMITS = {
-      "linkedin": 750,
-      "medium": 1500,
-      "x": 280,
-}
+
+PLATFORM_WORD_LIMITS = {name: spec.word_limit for name, spec in PLATFORMS.items()}
+
+# Static instructions shared by every platform request. Sent ahead of the
+# per-request text with its own cache breakpoint so it is a cache hit across
+# platforms.
+USER_PROMPT_RULES = "Use only verified facts from the profile. No fabrication."
 
 SYSTEM_PROMPT_PATH = os.path.join(os.path.dirname(__file__), "../prompts/system_prompt.txt")
 
+# Client-side cache of generated content, keyed on (pillar, platform, system
+# prompt hash). Module-level so re-runs within one process skip the API call.
+_GENERATION_CACHE: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
 
 class ContentGenerationError(Exception):
-      pass
+    pass
 
 
 class ClaudeClient:
-      """
-          Wraps the Anthropic Messages API with:
-              - Prompt caching (cache_control: ephemeral) for ~50% cost reduction
-                  - Exponential backoff with jitter for rate limit handling
-                      - Concurrent platform generation support
-                          """
+    """
+    Wraps the Anthropic Messages API with:
+        - Prompt caching (cache_control: ephemeral) for ~50% cost reduction
+        - Exponential backoff with jitter for rate limit handling
+        - Concurrent platform generation support
+        - Client-side TTL cache of generated content per (pillar, platform)
+        - Streamed responses; single-platform generations are aborted as soon
+          as a fabrication marker appears
+    """
 
     MODEL = "claude-sonnet-4-6"
     MAX_TOKENS = 4096
+    BATCH_MAX_TOKENS = 8192
     MAX_RETRIES = 3
+    MAX_CONNECTIONS = 32
 
     def __init__(self):
-              self.client = anthropic.AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-              self._system_prompt = self._load_system_prompt()
-
-    def _load_system_prompt(self) -> str:
-              with open(SYSTEM_PROMPT_PATH, "r") as f:
-                            return f.read()
-
-          async def generate(self, pillar: str, platform: str) -> str:
-                    """
-                            Generate platform-optimized content for a given content pillar.
-
-                                    Args:
-                                                pillar: Content pillar (e.g. 'ios_swift', 'ai_mobile', 'career_mentorship')
-                                                            platform: Target platform ('linkedin', 'medium', 'x')
-
-                                                                    Returns:
-                                                                                Generated content string
-
-                                                                                        Raises:
-                                                                                                    ContentGenerationError: If all retry attempts fail
-                                                                                                            """
-                    word_limit = PLATFORM_WORD_LIMITS.get(platform, 500)
-                    user_prompt = (
-                        f"Write a {platform} post for the '{pillar}' content pillar. "
-                        f"Target length: {word_limit} words. "
-                        f"Use only verified facts from the profile. No fabrication."
-                    )
-                    return await self._call_with_retry(user_prompt)
-
-    async def _call_with_retry(self, prompt: str) -> str:
-              for attempt in range(self.MAX_RETRIES):
-                            try:
-                                              response = await self.client.messages.create(
-                                                                    model=self.MODEL,
-                                                                    max_tokens=self.MAX_TOKENS,
-                                                                    system=[{
-                                                                                              "type": "text",
-                                                                                              "text": self._system_prompt,
-                                                                                              "cache_control": {"type": "ephemeral"}  # ~50% cost reduction
-                                                                    }],
-                                                                    messages=[{"role": "user", "content": prompt}]
-                                              )
-                                              return response.content[0].text
-
-                            except RateLimitError:
-                                              if attempt == self.MAX_RETRIES - 1:
-                                                                    raise ContentGenerationError("Rate limit exceeded after max retries")
-                                                                backoff = (2 ** attempt) + random.uniform(0, 1)
-                                              await asyncio.sleep(backoff)
-
-                            except APIError as e:
-                                              if attempt == self.MAX_RETRIES - 1:
-                                                                    raise ContentGenerationError(f"API error after {self.MAX_RETRIES} attempts: {e}")
-                                                                await asyncio.sleep(1)
-                              
+        # HTTP/2 lets the concurrent platform generations multiplex over one
+        # pooled TLS connection instead of opening one per call.
+        self.client = anthropic.AsyncAnthropic(
+            api_key=os.environ["ANTHROPIC_API_KEY"],
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_CONNECTIONS,
+                ),
+            ),
+        )
+        self._system_prompt = self._load_system_prompt()
+        self._prompt_hash = hash(self._system_prompt)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _load_system_prompt() -> str:
+        """Read the system prompt from disk (once per process)."""
+        with open(SYSTEM_PROMPT_PATH, "r") as f:
+            return f.read()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
+
+    async def generate(self, pillar: str, platform: str) -> str:
+        """
+        Generate platform-optimized content for a given content pillar.
+
+        Args:
+            pillar: Content pillar (e.g. 'ios_swift', 'ai_mobile', 'career_mentorship')
+            platform: Target platform ('linkedin', 'medium', 'x')
+
+        Returns:
+            Generated content string
+
+        Raises:
+            ContentGenerationError: If all retry attempts fail or the output
+                is aborted on a fabrication marker
+        """
+        cache_key = self._cache_key(pillar, platform)
+        if cache_key in _GENERATION_CACHE:
+            return _GENERATION_CACHE[cache_key]
+
+        word_limit = PLATFORM_WORD_LIMITS.get(platform, 500)
+        user_prompt = (
+            f"Write a {platform} post for the '{pillar}' content pillar. "
+            f"Target length: {word_limit} words."
+        )
+        content = await self._call_with_retry(user_prompt, abort_on_fabrication=True)
+        _GENERATION_CACHE[cache_key] = content
+        return content
+
+    async def generate_batch(self, pillar: str, platforms: list[str]) -> dict[str, str]:
+        """
+        Generate content for several platforms in a single API call.
+        Platforms with a cached generation are served from the cache and
+        left out of the request.
+
+        Unlike generate(), the stream is never aborted on a fabrication marker:
+        one platform's marker must not discard the other platforms' posts, and
+        the raw JSON text (escaped newlines etc.) isn't the post text anyway.
+        Each decoded post is validated separately by the caller.
+
+        Args:
+            pillar: Content pillar (e.g. 'ios_swift', 'ai_mobile', 'career_mentorship')
+            platforms: Target platforms ('linkedin', 'medium', 'x')
+
+        Returns:
+            Dict of {platform: generated content}
+
+        Raises:
+            ContentGenerationError: If all retry attempts fail or the response
+                is not a JSON object with a post for every platform
+        """
+        posts = {}
+        for platform in platforms:
+            cache_key = self._cache_key(pillar, platform)
+            if cache_key in _GENERATION_CACHE:
+                posts[platform] = _GENERATION_CACHE[cache_key]
+
+        missing = [platform for platform in platforms if platform not in posts]
+        if missing:
+            targets = "\n".join(
+                f"- {platform}: {PLATFORM_WORD_LIMITS.get(platform, 500)} words"
+                for platform in missing
+            )
+            user_prompt = (
+                f"Write one post per platform for the '{pillar}' content pillar.\n"
+                f"Target lengths:\n{targets}\n"
+                f"Respond with only a JSON object whose keys are {json.dumps(missing)} "
+                f"and whose values are the post text for that platform."
+            )
+            raw = await self._call_with_retry(user_prompt, max_tokens=self.BATCH_MAX_TOKENS)
+            for platform, content in self._parse_batch(raw, missing).items():
+                _GENERATION_CACHE[self._cache_key(pillar, platform)] = content
+                posts[platform] = content
+
+        return {platform: posts[platform] for platform in platforms}
+
+    def invalidate(self, pillar: str, platform: str) -> None:
+        """Drop a cached generation, e.g. after it failed validation or was published."""
+        _GENERATION_CACHE.pop(self._cache_key(pillar, platform), None)
+
+    def _cache_key(self, pillar: str, platform: str) -> tuple[str, str, int]:
+        return (pillar, platform, self._prompt_hash)
+
+    @staticmethod
+    def _parse_batch(raw: str, platforms: list[str]) -> dict[str, str]:
+        """Extract the {platform: content} object, tolerating surrounding prose or code fences."""
+        start, end = raw.find("{"), raw.rfind("}")
+        try:
+            posts = json.loads(raw[start:end + 1]) if start != -1 else None
+        except json.JSONDecodeError as e:
+            raise ContentGenerationError(f"Batch response is not valid JSON: {e}") from e
+        if not isinstance(posts, dict):
+            raise ContentGenerationError("Batch response did not contain a JSON object")
+
+        missing = [platform for platform in platforms if not isinstance(posts.get(platform), str)]
+        if missing:
+            raise ContentGenerationError(f"Batch response missing platforms: {missing}")
+        return {platform: posts[platform] for platform in platforms}
+
+    async def _stream_message(
+        self, user_content: list[dict], max_tokens: int, abort_on_fabrication: bool
+    ) -> str:
+        """
+        Stream the response. With abort_on_fabrication, the text is scanned
+        for fabrication markers as it arrives and a hit closes the stream
+        immediately, saving the remaining output tokens and wall-clock on a
+        generation that validation would reject anyway. The full
+        ContentValidator pass still runs on the finished content.
+        """
+        chunks = []
+        scanner = FabricationScanner() if abort_on_fabrication else contextlib.nullcontext()
+        with scanner:
+            async with self.client.messages.stream(
+                model=self.MODEL,
+                max_tokens=max_tokens,
+                system=[{
+                    "type": "text",
+                    "text": self._system_prompt,
+                    "cache_control": {"type": "ephemeral"}  # ~50% cost reduction
+                }],
+                messages=[{"role": "user", "content": user_content}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    if abort_on_fabrication and scanner.feed(text):
+                        raise ContentGenerationError(
+                            "Generation aborted: fabrication marker detected in output"
+                        )
+        return "".join(chunks)
+
+    async def _call_with_retry(
+        self, prompt: str, max_tokens: int = MAX_TOKENS, abort_on_fabrication: bool = False
+    ) -> str:
+        user_content = [
+            {
+                "type": "text",
+                "text": USER_PROMPT_RULES,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {"type": "text", "text": prompt},
+        ]
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return await self._stream_message(user_content, max_tokens, abort_on_fabrication)
+
+            except RateLimitError as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise ContentGenerationError("Rate limit exceeded after max retries")
+                await asyncio.sleep(self._rate_limit_delay(e, attempt))
+
+            except APIError as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise ContentGenerationError(f"API error after {self.MAX_RETRIES} attempts: {e}")
+                await asyncio.sleep(1)
+
+    @staticmethod
+    def _rate_limit_delay(error: RateLimitError, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a rate-limited call.
+
+        Honors the server's hint (`retry-after`, else the
+        `anthropic-ratelimit-requests-reset` timestamp) plus up to a second of
+        jitter. Without a hint, falls back to jittered exponential backoff.
+        """
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+
+        hint = None
+        try:
+            hint = float(headers["retry-after"])
+        except (KeyError, TypeError, ValueError):
+            try:
+                reset = datetime.fromisoformat(headers["anthropic-ratelimit-requests-reset"])
+                hint = (reset - datetime.now(timezone.utc)).total_seconds()
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        if hint is not None:
+            return max(hint, 0.0) + random.uniform(0, 1)
+        base = 2 ** attempt
+        return random.uniform(base, base * 3)
@@ -9,67 +9,124 @@ import asyncio
 from dataclasses import dataclass
 from typing import Optional
 
+from publishers import LinkedInPublisher, MediumPublisher, TwitterPublisher
+
 from .claude_client import ClaudeClient
+from .platforms import PLATFORMS
 from .validator import ContentValidator
 
 
 @dataclass
 class PipelineConfig:
-      platforms: list[str]
-      pillar: str
-      dry_run: bool = False
+    platforms: list[str]
+    pillar: str
+    dry_run: bool = False
 
 
 class ContentPipeline:
-      """
-          Main pipeline orchestrator.
-              Generates, validates, and publishes content across platforms concurrently.
-                  """
+    """
+    Main pipeline orchestrator.
+    Generates, validates, and publishes content across platforms concurrently.
+
+    The Claude client and publishers are kept for the pipeline's lifetime so
+    their connection pools are reused; call aclose() (or use `async with`) to
+    release them.
+    """
+
+    SUPPORTED_PLATFORMS = list(PLATFORMS)
 
-    SUPPORTED_PLATFORMS = ["linkedin", "medium", "x"]
+    # Publisher implementations live in publishers/
+    _PUBLISHERS = {
+        "linkedin": LinkedInPublisher,
+        "medium": MediumPublisher,
+        "x": TwitterPublisher,
+    }
 
     def __init__(self, config: PipelineConfig):
-              self.config = config
-              self.claude_client = ClaudeClient()
-              self.validator = ContentValidator()
+        self.config = config
+        self.claude_client = ClaudeClient()
+        self.validator = ContentValidator()
+        self._publishers: dict[str, object] = {}
+
+    async def __aenter__(self) -> "ContentPipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def run(self) -> dict[str, str]:
-              """
-                      Run the full pipeline for all configured platforms.
-                              Returns a dict of {platform: result_status}.
-                                      """
-              tasks = {
-                  platform: self._generate_and_publish(platform)
-                  for platform in self.config.platforms
-                  if platform in self.SUPPORTED_PLATFORMS
-              }
-
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-        return dict(zip(tasks.keys(), results))
-
-    async def _generate_and_publish(self, platform: str) -> str:
-              content = await self.claude_client.generate(
-                            pillar=self.config.pillar,
-                            platform=platform
-              )
-              validation = self.validator.validate(content, platform)
-              if not validation.passed:
-                            raise ValueError(f"Validation failed for {platform}: {validation.failures}")
-
-              if self.config.dry_run:
-                            return f"[DRY RUN] Would publish to {platform}"
-
-              # Publisher implementations live in publishers/
-              publisher = self._get_publisher(platform)
-              return await publisher.publish(content)
+        """
+        Run the full pipeline for all configured platforms.
+        Content for every platform is generated in a single Claude request.
+        Returns a dict of {platform: result_status}; platforms that fail the
+        precheck (e.g. unknown platforms) map to a ValueError.
+        """
+        platforms = list(dict.fromkeys(self.config.platforms))
+
+        # Reject bad inputs before paying for a Claude round-trip.
+        results = {}
+        for platform in platforms:
+            precheck = self.validator.precheck(self.config.pillar, platform)
+            if not precheck.passed:
+                results[platform] = ValueError(f"Precheck failed for {platform}: {precheck.failures}")
+        ready = [platform for platform in platforms if platform not in results]
+
+        if ready:
+            try:
+                contents = await self.claude_client.generate_batch(
+                    pillar=self.config.pillar,
+                    platforms=ready
+                )
+            except Exception as e:
+                contents = {}
+                results.update({platform: e for platform in ready})
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    platform: tg.create_task(self._settle(self._validate_and_publish(platform, content)))
+                    for platform, content in contents.items()
+                }
+            results.update({platform: task.result() for platform, task in tasks.items()})
+
+        return {platform: results[platform] for platform in platforms}
+
+    async def aclose(self) -> None:
+        """Close the Claude client and every publisher created by this pipeline."""
+        publishers, self._publishers = self._publishers, {}
+        await asyncio.gather(
+            self.claude_client.aclose(),
+            *(publisher.aclose() for publisher in publishers.values()),
+        )
+
+    async def _validate_and_publish(self, platform: str, content: str) -> str:
+        validation = self.validator.validate(content, platform)
+        if not validation.passed:
+            # Don't let a rejected generation be served from the cache on re-run.
+            self.claude_client.invalidate(self.config.pillar, platform)
+            raise ValueError(f"Validation failed for {platform}: {validation.failures}")
+
+        if self.config.dry_run:
+            return f"[DRY RUN] Would publish to {platform}"
+
+        publisher = self._get_publisher(platform)
+        result = await publisher.publish(content)
+        # Published content must not be replayed by a re-run (X rejects
+        # duplicate tweets; Medium would get a duplicate draft).
+        self.claude_client.invalidate(self.config.pillar, platform)
+        return result
+
+    @staticmethod
+    async def _settle(coro):
+        """
+        Return a failed platform's exception as its result so it does not
+        cancel the other platforms' tasks. Cancellation still propagates.
+        """
+        try:
+            return await coro
+        except Exception as e:
+            return e
 
     def _get_publisher(self, platform: str):
-              from publishers.linkedin_publisher import LinkedInPublisher
-              from publishers.medium_publisher import MediumPublisher
-              from publishers.twitter_publisher import TwitterPublisher
-
-        return {
-                      "linkedin": LinkedInPublisher,
-                      "medium": MediumPublisher,
-                      "x": TwitterPublisher,
-        }[platform]()
+        if platform not in self._publishers:
+            self._publishers[platform] = self._PUBLISHERS[platform]()
+        return self._publishers[platform]
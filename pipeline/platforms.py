@@ -0,0 +1,21 @@
+"""
+platforms.py
+
+Single registry of supported platforms and their content limits.
+Generation targets and validation limits are both derived from PLATFORMS.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PlatformSpec:
+    word_limit: int  # target length requested from Claude
+    max_chars: int   # hard limit enforced by the validator
+
+
+PLATFORMS = {
+    "linkedin": PlatformSpec(word_limit=750, max_chars=3000),
+    "medium": PlatformSpec(word_limit=1500, max_chars=50000),
+    "x": PlatformSpec(word_limit=280, max_chars=280),
+}
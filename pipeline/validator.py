@@ -8,57 +8,204 @@ platform requirements, and voice consistency before publishing.
 import re
 from dataclasses import dataclass, field
 
+from .platforms import PLATFORMS
+
+try:
+    import hyperscan
+except ImportError:  # optional: falls back to the compiled `re` alternation below
+    hyperscan = None
+
 
 FABRICATION_MARKERS = [
-      r"\bonce told me\b",
-      r"\ba mentee of mine\b",
-      r"\bI remember when\b",
-      r"\btrue story\b",
-      r"\bfun fact about me\b",
+    r"\bonce told me\b",
+    r"\ba mentee of mine\b",
+    r"\bI remember when\b",
+    r"\btrue story\b",
+    r"\bfun fact about me\b",
 ]
 
-PLATFORM_MAX_CHARS = {
-      "x": 280,
-      "linkedin": 3000,
-      "medium": 50000,
-}
+# All markers in one alternation so content is scanned once, not once per marker.
+# Each marker gets its own named group so a match maps back to its pattern.
+_FABRICATION_RE = re.compile(
+    "|".join(f"(?P<m{i}>{pattern})" for i, pattern in enumerate(FABRICATION_MARKERS)),
+    re.IGNORECASE,
+)
+
+
+# Characters of already-scanned text re-scanned by FabricationScanner; longer
+# than any marker so split markers are still found.
+_STREAM_OVERLAP = 64
+
+# Hyperscan is only a prefilter: its \b and CASELESS are ASCII-only, while `re`
+# treats Unicode letters as word characters. Every Hyperscan hit is confirmed
+# with _FABRICATION_RE. These are the non-ASCII characters `re` case-folds onto
+# ASCII letters (İ ı ſ K); Hyperscan cannot see them, so content containing
+# them goes straight to `re`. Together this keeps the verdict identical whether
+# or not Hyperscan is installed.
+_NON_ASCII_CASEFOLDS = re.compile("[\u0130\u0131\u017f\u212a]")
+
+
+def _compile_fabrication_db(mode: int, flags: int):
+    """Compile every marker into a single Hyperscan DFA (one SIMD pass over the content)."""
+    db = hyperscan.Database(mode=mode)
+    db.compile(
+        expressions=[pattern.encode() for pattern in FABRICATION_MARKERS],
+        ids=list(range(len(FABRICATION_MARKERS))),
+        elements=len(FABRICATION_MARKERS),
+        flags=[hyperscan.HS_FLAG_CASELESS | flags] * len(FABRICATION_MARKERS),
+    )
+    return db
+
+
+# Block mode only needs to know whether anything matched, so SINGLEMATCH keeps
+# callbacks to at most one per marker. Stream mode must keep reporting: a
+# rejected candidate must not hide a later real occurrence of the same marker.
+_FABRICATION_DB = (
+    _compile_fabrication_db(hyperscan.HS_MODE_BLOCK, hyperscan.HS_FLAG_SINGLEMATCH)
+    if hyperscan else None
+)
+_FABRICATION_STREAM_DB = (
+    _compile_fabrication_db(hyperscan.HS_MODE_STREAM, 0)
+    if hyperscan else None
+)
+
+PLATFORM_MAX_CHARS = {name: spec.max_chars for name, spec in PLATFORMS.items()}
 
 
 @dataclass
 class ValidationResult:
-      passed: bool
-      failures: list[str] = field(default_factory=list)
+    passed: bool
+    failures: list[str] = field(default_factory=list)
+
+
+class FabricationScanner:
+    """
+    Incremental fabrication-marker scan over streamed text.
+
+    feed() each chunk as it arrives; it returns True once any marker has been
+    seen, including markers split across chunks. Use as a context manager so
+    the underlying Hyperscan stream is closed.
+    """
+
+    def __init__(self):
+        self.found = False
+        self._stream = None
+        self._candidate = False
+        self._tail = ""
+
+    def __enter__(self) -> "FabricationScanner":
+        if _FABRICATION_STREAM_DB is not None:
+            # Hyperscan does not own a reference to the handler, so keep the
+            # bound method alive for as long as the stream is open.
+            self._on_match_handler = self._on_match
+            self._stream = _FABRICATION_STREAM_DB.stream(
+                match_event_handler=self._on_match_handler
+            ).__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._close_stream()
+
+    def feed(self, chunk: str) -> bool:
+        if self.found:
+            return True
+
+        window = self._tail + chunk
+        if self._stream is not None and _NON_ASCII_CASEFOLDS.search(chunk):
+            # Hyperscan can't match these folds; finish the stream with `re`.
+            self._close_stream()
+
+        if self._stream is not None:
+            self._candidate = False
+            self._stream.scan(chunk.encode())
+            if self._candidate:
+                self.found = self._confirm(window)
+        else:
+            self.found = self._confirm(window)
+
+        self._tail = window[-_STREAM_OVERLAP:]
+        return self.found
+
+    def _confirm(self, window: str) -> bool:
+        """
+        Search the new chunk plus the overlap with `re`. The overlap's first
+        character only supplies left-hand context for the word boundary, and a
+        match ending at the end of the window is deferred until the next chunk
+        shows whether its trailing boundary really holds.
+        """
+        start = 1 if len(self._tail) == _STREAM_OVERLAP else 0
+        return any(
+            match.end() < len(window)
+            for match in _FABRICATION_RE.finditer(window, start)
+        )
+
+    def _close_stream(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _on_match(self, marker_id, start, end, flags, context) -> None:
+        self._candidate = True
 
 
 class ContentValidator:
-      """
-          Runs sequential validation checks on generated content.
-              All checks must pass for content to be published.
-                  """
+    """
+    Runs sequential validation checks on generated content.
+    All checks must pass for content to be published.
+    """
+
+    def precheck(self, pillar: str, platform: str) -> ValidationResult:
+        """
+        Cheap structural checks on the inputs, run before any content is
+        generated so bad configs fail without paying for an API call.
+        """
+        failures = []
+
+        if not pillar or not pillar.strip():
+            failures.append("Content pillar is empty")
+        if platform not in PLATFORMS:
+            failures.append(f"Unknown platform: '{platform}'")
+
+        return ValidationResult(passed=len(failures) == 0, failures=failures)
 
     def validate(self, content: str, platform: str) -> ValidationResult:
-              failures = []
+        failures = []
 
-        failures += self._check_fabrication(content)
-        failures += self._check_platform_limits(content, platform)
+        # O(1) length checks first; skip the full-content fabrication scan
+        # when the content is already disqualified.
         failures += self._check_not_empty(content)
+        failures += self._check_platform_limits(content, platform)
+        if not failures:
+            failures += self._check_fabrication(content)
 
         return ValidationResult(passed=len(failures) == 0, failures=failures)
 
     def _check_fabrication(self, content: str) -> list[str]:
-              found = []
-              for pattern in FABRICATION_MARKERS:
-                            if re.search(pattern, content, re.IGNORECASE):
-                                              found.append(f"Fabrication marker detected: '{pattern}'")
-                                      return found
+        if _FABRICATION_DB is not None and not _NON_ASCII_CASEFOLDS.search(content):
+            # Clean content (the common case) costs a single Hyperscan pass;
+            # only a candidate hit pays for the exact `re` scan below.
+            candidates = []
+
+            def on_match(marker_id, start, end, flags, context):
+                candidates.append(marker_id)
+
+            _FABRICATION_DB.scan(content.encode(), match_event_handler=on_match)
+            if not candidates:
+                return []
+
+        hits = {int(match.lastgroup[1:]) for match in _FABRICATION_RE.finditer(content)}
+        return [
+            f"Fabrication marker detected: '{FABRICATION_MARKERS[i]}'"
+            for i in sorted(hits)
+        ]
 
     def _check_platform_limits(self, content: str, platform: str) -> list[str]:
-              max_chars = PLATFORM_MAX_CHARS.get(platform)
-              if max_chars and len(content) > max_chars:
-                            return [f"Content exceeds {platform} limit: {len(content)} > {max_chars} chars"]
-                        return []
+        max_chars = PLATFORM_MAX_CHARS.get(platform)
+        if max_chars and len(content) > max_chars:
+            return [f"Content exceeds {platform} limit: {len(content)} > {max_chars} chars"]
+        return []
 
     def _check_not_empty(self, content: str) -> list[str]:
-              if not content or len(content.strip()) < 50:
-                            return ["Content is empty or too short"]
-                        return []
+        if not content or len(content.strip()) < 50:
+            return ["Content is empty or too short"]
+        return []
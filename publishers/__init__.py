@@ -1,7 +1,8 @@
 """
 publishers — Platform-specific content publishing adapters.
 
-Each publisher implements an async `publish(content: str) -> str` interface.
+Each publisher implements an async `publish(content: str) -> str` interface
+and an async `aclose()` that releases any connections or browsers it holds.
 
 Modules:
     linkedin_publisher:  Playwright browser automation (no public API).
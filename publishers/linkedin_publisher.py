@@ -17,58 +17,137 @@ This automation uses browser interaction via Playwright.
 Docs: https://playwright.dev/python/docs/api/class-page
 """
 
+import asyncio
 import os
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, BrowserContext, Page, Playwright, Route
 
 
 class LinkedInPublisherError(Exception):
-      pass
+    pass
 
 
 class LinkedInPublisher:
-      """
-          Publishes content to LinkedIn via Playwright browser automation.
+    """
+    Publishes content to LinkedIn via Playwright browser automation.
 
-              Selectors are abstracted into helper methods to isolate LinkedIn UI changes.
-                  Update _find_* methods when LinkedIn's UI changes — do NOT hardcode selectors inline.
-                      """
+    Selectors are abstracted into helper methods to isolate LinkedIn UI changes.
+    Update _find_* methods when LinkedIn's UI changes — do NOT hardcode selectors inline.
+
+    The browser is launched once (on first publish or via startup()) and kept
+    alive across publishes; each publish only opens and closes a page.
+    Call aclose() to shut the browser down.
+
+    The browser profile (cookies, LinkedIn session) is persisted in
+    LINKEDIN_USER_DATA_DIR, so a login done once with LINKEDIN_HEADLESS=false
+    is reused by later headless runs.
+    """
 
     LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
+    BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+    DEFAULT_USER_DATA_DIR = "~/.cache/linkedin_browser_profile"
+    LOGIN_TIMEOUT_MS = 300_000
+
+    def __init__(self):
+        self._playwright: Playwright | None = None
+        self._context: BrowserContext | None = None
+        self._headless = True
+        self._startup_lock = asyncio.Lock()
+
+    async def startup(self) -> None:
+        """Start Playwright and launch the browser if not already running."""
+        async with self._startup_lock:
+            if self._context is not None:
+                return
+            # Set LINKEDIN_HEADLESS=false to watch the browser (e.g. to log in).
+            self._headless = os.environ.get("LINKEDIN_HEADLESS", "true").lower() != "false"
+            user_data_dir = os.path.expanduser(
+                os.environ.get("LINKEDIN_USER_DATA_DIR", self.DEFAULT_USER_DATA_DIR)
+            )
+            try:
+                self._playwright = await async_playwright().start()
+                # A persistent context keeps the LinkedIn session between runs.
+                self._context = await self._playwright.chromium.launch_persistent_context(
+                    user_data_dir,
+                    headless=self._headless,
+                    args=["--disable-dev-shm-usage"],
+                )
+                if self._headless:
+                    # The composer only needs the DOM and scripts; skipping heavy
+                    # assets lets the "networkidle" wait resolve much sooner.
+                    # Headed runs keep them so the login page renders normally.
+                    await self._context.route("**/*", self._block_heavy_resources)
+            except Exception:
+                # Don't leave a half-started driver behind for the next
+                # publish() to orphan.
+                await self.aclose()
+                raise
+
+    async def _block_heavy_resources(self, route: Route) -> None:
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def publish(self, content: str) -> str:
-              async with async_playwright() as p:
-                            browser = await p.chromium.launch(headless=False)
-                            page = await browser.new_page()
-
-                  try:
-                                    await page.goto(self.LINKEDIN_FEED_URL)
-                                    await self._open_post_composer(page)
-                                    await self._fill_post_content(page, content)
-                                    await self._submit_post(page)
-                                    return "LinkedIn: published successfully"
-except Exception as e:
-                raise LinkedInPublisherError(f"LinkedIn publish failed: {e}") from e
-finally:
-                await browser.close()
+        page = None
+        try:
+            await self.startup()
+            page = await self._context.new_page()
+            await page.goto(self.LINKEDIN_FEED_URL)
+            await self._ensure_logged_in(page)
+            await self._open_post_composer(page)
+            await self._fill_post_content(page, content)
+            await self._submit_post(page)
+            return "LinkedIn: published successfully"
+        except Exception as e:
+            raise LinkedInPublisherError(f"LinkedIn publish failed: {e}") from e
+        finally:
+            if page is not None:
+                await page.close()
+
+    async def _ensure_logged_in(self, page: Page) -> None:
+        """
+        LinkedIn redirects to its login wall when the saved session is missing
+        or expired. Headed runs wait for a manual login (saved to the profile
+        for later runs); headless runs fail fast with instructions.
+        """
+        if page.url.startswith(self.LINKEDIN_FEED_URL):
+            return
+        if self._headless:
+            raise LinkedInPublisherError(
+                "Not logged in to LinkedIn. Run once with LINKEDIN_HEADLESS=false and log in."
+            )
+        await page.wait_for_url(f"{self.LINKEDIN_FEED_URL}**", timeout=self.LOGIN_TIMEOUT_MS)
+
+    async def aclose(self) -> None:
+        """Close the browser and stop Playwright."""
+        context, playwright = self._context, self._playwright
+        self._playwright = self._context = None
+        try:
+            if context is not None:
+                await context.close()
+        finally:
+            if playwright is not None:
+                await playwright.stop()
 
     # --- Selector abstraction layer ---
-      # Update these methods when LinkedIn's UI changes.
-      # Do NOT hardcode selectors anywhere else in this file.
+    # Update these methods when LinkedIn's UI changes.
+    # Do NOT hardcode selectors anywhere else in this file.
 
     async def _open_post_composer(self, page: Page) -> None:
-              """Clicks the 'Start a post' / share box to open the composer."""
+        """Clicks the 'Start a post' / share box to open the composer."""
         # TODO: Update selector when LinkedIn changes the share box component
         composer_trigger = await page.wait_for_selector("[data-test='share-box-click-card']", timeout=10000)
         await composer_trigger.click()
 
     async def _fill_post_content(self, page: Page, content: str) -> None:
-              """Types content into the post text editor."""
+        """Types content into the post text editor."""
         # TODO: Update selector when LinkedIn changes the editor component
         editor = await page.wait_for_selector("[data-testid='share-creation-state-text-editor']", timeout=10000)
         await editor.fill(content)
 
     async def _submit_post(self, page: Page) -> None:
-              """Clicks the publish/post button."""
+        """Clicks the publish/post button."""
         # TODO: Update selector when LinkedIn changes the publish button component
         publish_btn = await page.wait_for_selector("[data-testid='share-creation-state-publish-button']", timeout=10000)
         await publish_btn.click()
@@ -10,12 +10,19 @@ Setup:
 1. Go to Settings → Security and apps → Integration tokens
 2. Generate a token and add it to your .env as MEDIUM_INTEGRATION_TOKEN
 3. Optionally set MEDIUM_PUBLISH_STATUS to 'draft' or 'public' (default: draft)
+
+The authenticated user's ID is resolved once and cached in ~/.cache/medium_user_id,
+so warm runs publish with a single POST.
 """
 
+import hashlib
 import os
 import httpx
 
 
+USER_ID_CACHE_PATH = os.path.expanduser("~/.cache/medium_user_id")
+
+
 class MediumPublisherError(Exception):
     pass
 
@@ -32,7 +39,13 @@ class MediumPublisher:
 
     def __init__(self):
         self.token = os.environ["MEDIUM_INTEGRATION_TOKEN"]
-        self._user_id: str | None = None
+        self._user_id: str | None = self._load_cached_user_id()
+        # One pooled client per publisher so /me and /posts share a connection.
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
 
     async def publish(self, content: str) -> str:
         """
@@ -57,19 +70,19 @@ class MediumPublisher:
             raise MediumPublisherError(f"Medium publish failed: {e}") from e
 
     async def _get_user_id(self) -> str:
-        """Fetch the authenticated user's ID (cached after first call)."""
+        """Fetch the authenticated user's ID (cached in memory and on disk)."""
         if self._user_id:
             return self._user_id
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.BASE_URL}/me",
-                headers=self._auth_headers(),
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            self._user_id = response.json()["data"]["id"]
-            return self._user_id
+        response = await self._client.get(
+            f"{self.BASE_URL}/me",
+            headers=self._auth_headers(),
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        self._user_id = response.json()["data"]["id"]
+        self._store_cached_user_id(self._user_id)
+        return self._user_id
 
     async def _create_post(self, user_id: str, content: str) -> str:
         """
@@ -87,15 +100,42 @@ class MediumPublisher:
             "publishStatus": publish_status,
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.BASE_URL}/users/{user_id}/posts",
-                headers=self._auth_headers(),
-                json=payload,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()["data"]["url"]
+        response = await self._client.post(
+            f"{self.BASE_URL}/users/{user_id}/posts",
+            headers=self._auth_headers(),
+            json=payload,
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        return response.json()["data"]["url"]
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    def _token_fingerprint(self) -> str:
+        """Identify the token in the cache file without storing the token itself."""
+        return hashlib.sha256(self.token.encode()).hexdigest()[:16]
+
+    def _load_cached_user_id(self) -> str | None:
+        """Return the cached user ID if it was resolved with the current token."""
+        try:
+            with open(USER_ID_CACHE_PATH, "r") as f:
+                fingerprint, _, user_id = f.read().strip().partition(" ")
+        except OSError:
+            return None
+        if fingerprint != self._token_fingerprint() or not user_id:
+            return None
+        return user_id
+
+    def _store_cached_user_id(self, user_id: str) -> None:
+        """Persist the user ID; the cache is best-effort, so failures are ignored."""
+        try:
+            os.makedirs(os.path.dirname(USER_ID_CACHE_PATH), exist_ok=True)
+            with open(USER_ID_CACHE_PATH, "w") as f:
+                f.write(f"{self._token_fingerprint()} {user_id}\n")
+        except OSError:
+            pass
 
     def _auth_headers(self) -> dict[str, str]:
         """Build authorization headers for Medium API requests."""
@@ -112,7 +152,9 @@ class MediumPublisher:
         the rest as body. Falls back to a truncated first line if no
         markdown heading is found.
         """
-        lines = content.strip().split("\n")
-        first_line = lines[0].strip().lstrip("#").strip() if lines else "Untitled"
-        body = "\n".join(lines[1:]).strip() if len(lines) > 1 else content
-        return first_line, body
+        # partition() only scans to the first newline instead of splitting
+        # the whole (possibly 50k-char) article into lines.
+        first_line, _, rest = content.strip().partition("\n")
+        title = first_line.strip().lstrip("#").strip() or "Untitled"
+        body = rest.strip() or content
+        return title, body
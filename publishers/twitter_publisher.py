@@ -12,12 +12,11 @@ Setup:
 3. Add all four values to your .env file (see .env.example)
 """
 
+import bisect
 import os
 import time
 import hashlib
-import hmac
 import base64
-import secrets
 import urllib.parse
 
 import httpx
@@ -44,6 +43,22 @@ class TwitterPublisher:
         self.access_token = os.environ["TWITTER_ACCESS_TOKEN"]
         self.access_token_secret = os.environ["TWITTER_ACCESS_TOKEN_SECRET"]
 
+        # Credentials are fixed per publisher, so percent-encode them once
+        # rather than on every signed request.
+        self._quoted_consumer_key = urllib.parse.quote(self.consumer_key, safe="")
+        self._quoted_access_token = urllib.parse.quote(self.access_token, safe="")
+        signing_key = (
+            f"{urllib.parse.quote(self.consumer_secret, safe='')}&"
+            f"{urllib.parse.quote(self.access_token_secret, safe='')}"
+        ).encode("ascii")
+        self._hmac_inner, self._hmac_outer = self._prepare_hmac_sha1(signing_key)
+
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+
     async def publish(self, content: str) -> str:
         """
         Publish content as a tweet.
@@ -71,15 +86,18 @@ class TwitterPublisher:
         headers = self._build_oauth_headers("POST", self.TWEET_ENDPOINT)
         headers["Content-Type"] = "application/json"
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TWEET_ENDPOINT,
-                headers=headers,
-                json={"text": text},
-                timeout=15.0,
-            )
-            response.raise_for_status()
-            return response.json()["data"]["id"]
+        response = await self._client.post(
+            self.TWEET_ENDPOINT,
+            headers=headers,
+            json={"text": text},
+            timeout=15.0,
+        )
+        response.raise_for_status()
+        return response.json()["data"]["id"]
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
 
     def _truncate(self, content: str) -> str:
         """Truncate content to MAX_TWEET_LENGTH with ellipsis if needed."""
@@ -89,6 +107,21 @@ class TwitterPublisher:
 
     # --- OAuth 1.0a signing ---
 
+    @staticmethod
+    def _prepare_hmac_sha1(key: bytes) -> tuple:
+        """
+        Return SHA-1 states that have already absorbed the HMAC inner and outer
+        key pads (RFC 2104). Signing then only copies these states, so no pad is
+        rebuilt and no hmac wrapper runs per request.
+        """
+        block_size = 64
+        if len(key) > block_size:
+            key = hashlib.sha1(key).digest()
+        key = key.ljust(block_size, b"\0")
+        inner = hashlib.sha1(bytes(b ^ 0x36 for b in key))
+        outer = hashlib.sha1(bytes(b ^ 0x5C for b in key))
+        return inner, outer
+
     def _build_oauth_headers(self, method: str, url: str) -> dict[str, str]:
         """
         Build OAuth 1.0a Authorization header for X API requests.
@@ -96,20 +129,21 @@ class TwitterPublisher:
         Implements the signature base string and HMAC-SHA1 signing
         per https://developer.x.com/en/docs/authentication/oauth-1-0a/creating-a-signature
         """
+        # Values are stored already percent-encoded. The oauth_* keys, the hex
+        # nonce and the numeric timestamp contain only unreserved characters,
+        # so quoting them would be a no-op.
         oauth_params = {
-            "oauth_consumer_key": self.consumer_key,
-            "oauth_nonce": secrets.token_hex(16),
+            "oauth_consumer_key": self._quoted_consumer_key,
+            "oauth_nonce": os.urandom(16).hex(),
             "oauth_signature_method": "HMAC-SHA1",
             "oauth_timestamp": str(int(time.time())),
-            "oauth_token": self.access_token,
+            "oauth_token": self._quoted_access_token,
             "oauth_version": "1.0",
         }
 
         # Build signature base string
-        param_string = "&".join(
-            f"{urllib.parse.quote(k, safe='')}={urllib.parse.quote(v, safe='')}"
-            for k, v in sorted(oauth_params.items())
-        )
+        sorted_params = sorted(oauth_params.items())
+        param_string = "&".join(f"{k}={v}" for k, v in sorted_params)
         base_string = (
             f"{method.upper()}&"
             f"{urllib.parse.quote(url, safe='')}&"
@@ -117,24 +151,16 @@ class TwitterPublisher:
         )
 
         # Sign with HMAC-SHA1
-        signing_key = (
-            f"{urllib.parse.quote(self.consumer_secret, safe='')}&"
-            f"{urllib.parse.quote(self.access_token_secret, safe='')}"
-        )
-        signature = base64.b64encode(
-            hmac.new(
-                signing_key.encode(),
-                base_string.encode(),
-                hashlib.sha1,
-            ).digest()
-        ).decode()
+        inner = self._hmac_inner.copy()
+        inner.update(base_string.encode("ascii"))
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        signature = base64.b64encode(outer.digest()).decode("ascii")
 
-        oauth_params["oauth_signature"] = signature
+        # Insert in place so the header reuses the already-sorted params.
+        bisect.insort(sorted_params, ("oauth_signature", urllib.parse.quote(signature, safe="")))
 
         # Format as Authorization header
-        auth_header = "OAuth " + ", ".join(
-            f'{urllib.parse.quote(k, safe="")}="{urllib.parse.quote(v, safe="")}"'
-            for k, v in sorted(oauth_params.items())
-        )
+        auth_header = "OAuth " + ", ".join(f'{k}="{v}"' for k, v in sorted_params)
 
         return {"Authorization": auth_header}